@@ -13,50 +13,95 @@ Output:
     - Prints 'true' for transactions in even-numbered blocks
     - Prints 'false' for transactions in odd-numbered blocks or invalid input
 
-Note: Block numbers are extracted from the EVM transaction data and converted
-from hexadecimal to decimal before processing.
+Set FILTER_DEBUG=1 to print diagnostic messages to stderr.
+
+Note: Block numbers are extracted from the EVM transaction data as 0x-prefixed
+hexadecimal strings. Once the string is validated, only its last digit is needed
+to determine parity.
 """
+import os
+import re
 import sys
-import json
 
-def main():
+try:
+    import orjson as json
+except ImportError:
+    import json
+
+DEBUG = os.environ.get("FILTER_DEBUG") == "1"
+
+# Pre-encoded result lines written straight to the binary stdout buffer
+TRUE_OUTPUT = b"true\n"
+FALSE_OUTPUT = b"false\n"
+
+# EVM block numbers are 0x-prefixed hex quantities
+HEX_BLOCK_NUMBER_PATTERN = re.compile(r"0[xX][0-9a-fA-F]+")
+
+def is_even(number):
+    """Returns True if the given block number is even."""
+    return not (number & 1)
+
+def get_block_number(monitor_match):
+    """Returns the hex block number of a decoded monitor match, or None if it is missing."""
+    try:
+        return monitor_match['EVM']['transaction']['blockNumber']
+    except (KeyError, TypeError):
+        return None
+
+def is_valid_block_number(hex_block):
+    """Returns True if the value is a 0x-prefixed hex string."""
+    return isinstance(hex_block, str) and HEX_BLOCK_NUMBER_PATTERN.fullmatch(hex_block) is not None
+
+def block_number_is_even(hex_block):
+    """Returns True if a valid hex block number is even."""
+    if not is_valid_block_number(hex_block):
+        return False
+
+    # A hex number has the same parity as its last digit, so skip converting the whole string
+    return is_even(int(hex_block[-1], 16))
+
+def filter_block_number(monitor_match):
+    """Returns True if a monitor match belongs to an even-numbered block."""
+    return block_number_is_even(get_block_number(monitor_match))
+
+def evaluate(input_data):
+    """Evaluates a single JSON payload, returning True for even-numbered blocks."""
     try:
-        # Read input from stdin
-        input_data = sys.stdin.read()
         if not input_data:
-            print("No input JSON provided", flush=True)
+            if DEBUG:
+                print("No input JSON provided", file=sys.stderr)
             return False
 
         # Parse input JSON
         try:
             data = json.loads(input_data)
             monitor_match = data['monitor_match']
-            args = data['args']
         except json.JSONDecodeError as e:
-            print(f"Invalid JSON input: {e}", flush=True)
+            if DEBUG:
+                print(f"Invalid JSON input: {e}", file=sys.stderr)
             return False
 
-        # Extract block_number
-        block_number = None
-        if "EVM" in monitor_match:
-            hex_block = monitor_match['EVM']['transaction'].get('blockNumber')
-            if hex_block:
-                # Convert hex string to integer
-                block_number = int(hex_block, 16)
-
-        if block_number is None:
-            print("Block number is None")
-            return False
-
-        result = block_number % 2 == 0
-        print(f"Block number {block_number} is {'even' if result else 'odd'}", flush=True)
+        result = filter_block_number(monitor_match)
+        if DEBUG:
+            hex_block = get_block_number(monitor_match)
+            if hex_block is None:
+                print("Block number is None", file=sys.stderr)
+            elif not is_valid_block_number(hex_block):
+                print(f"Block number {hex_block} is not a valid hex number", file=sys.stderr)
+            else:
+                print(f"Block number {hex_block} is {'even' if result else 'odd'}", file=sys.stderr)
         return result
 
     except Exception as e:
-        print(f"Error processing input: {e}", flush=True)
+        if DEBUG:
+            print(f"Error processing input: {e}", file=sys.stderr)
         return False
 
+def main():
+    # Read raw bytes from stdin in 64 KiB chunks until os.read() reports EOF
+    return evaluate(b"".join(iter(lambda: os.read(0, 1 << 16), b"")))
+
 if __name__ == "__main__":
     result = main()
     # Print the final boolean result
-    print(str(result).lower(), flush=True)
+    sys.stdout.buffer.write(TRUE_OUTPUT if result else FALSE_OUTPUT)
@@ -12,47 +12,92 @@ Input: JSON object containing:
 Output:
     - Prints 'true' for transactions in even-numbered blocks
     - Prints 'false' for transactions in odd-numbered blocks or invalid input
+
+Set FILTER_DEBUG=1 to print diagnostic messages to stderr.
+
+orjson and pysimdjson are used when installed, and the standard library json
+module otherwise.
 """
+import os
 import sys
-import json
-import logging
 
-def main():
+try:
+    import orjson as json
+except ImportError:
+    import json
+
+try:
+    import simdjson
+    _parser = simdjson.Parser()
+except ImportError:
+    simdjson = None
+
+DEBUG = os.environ.get("FILTER_DEBUG") == "1"
+
+# Pre-encoded result lines written straight to the binary stdout buffer
+TRUE_OUTPUT = b"true\n"
+FALSE_OUTPUT = b"false\n"
+
+def is_even(number):
+    """Returns True if the given ledger number is even."""
+    return not (number & 1)
+
+def get_monitor_match(input_data):
+    """Returns the monitor match from the raw input.
+
+    With simdjson this is a lazy view, so only the fields the filter reads get decoded.
+    """
+    if simdjson is not None:
+        return _parser.parse(input_data)['monitor_match']
+
+    return json.loads(input_data)['monitor_match']
+
+def get_sequence(monitor_match):
+    """Returns the ledger sequence of a decoded monitor match, or None if it is missing."""
+    try:
+        return monitor_match['Stellar']['ledger']['sequence']
+    except (KeyError, TypeError):
+        return None
+
+def ledger_is_even(ledger):
+    """Returns True if a ledger sequence value is present and even."""
+    try:
+        return bool(ledger) and is_even(int(ledger))
+    except (TypeError, ValueError):
+        return False
+
+def filter_block_number(monitor_match):
+    """Returns True if a monitor match belongs to an even-numbered ledger."""
+    return ledger_is_even(get_sequence(monitor_match))
+
+def evaluate(input_data):
+    """Evaluates a single JSON payload, returning True for even-numbered ledgers."""
     try:
-        # Read input from stdin
-        input_data = sys.stdin.read()
         if not input_data:
-            print("No input JSON provided", flush=True)
+            if DEBUG:
+                print("No input JSON provided", file=sys.stderr)
             return False
 
         # Parse input JSON
         try:
-            data = json.loads(input_data)
-            monitor_match = data['monitor_match']
-            args = data['args']
-        except json.JSONDecodeError:
-            print("Invalid JSON input", flush=True)
+            monitor_match = get_monitor_match(input_data)
+        except ValueError:
+            if DEBUG:
+                print("Invalid JSON input", file=sys.stderr)
             return False
 
-        # Extract ledger_number
-        ledger_number = None
-        if "Stellar" in monitor_match:
-            ledger = monitor_match['Stellar']['ledger'].get('sequence')
-            if ledger:
-                ledger_number = int(ledger)
-
-        if ledger_number is None:
-            return False
-
-        # Return True for even ledger numbers, False for odd
-        result = ledger_number % 2 == 0
-        return result
+        return filter_block_number(monitor_match)
 
     except Exception as e:
-        print(f"Error processing input: {e}", flush=True)
+        if DEBUG:
+            print(f"Error processing input: {e}", file=sys.stderr)
         return False
 
+def main():
+    # Read raw bytes from stdin in 64 KiB chunks until os.read() reports EOF
+    return evaluate(b"".join(iter(lambda: os.read(0, 1 << 16), b"")))
+
 if __name__ == "__main__":
     result = main()
     # Only print the final boolean result
-    print(str(result).lower(), flush=True)
+    sys.stdout.buffer.write(TRUE_OUTPUT if result else FALSE_OUTPUT)
@@ -8,30 +8,77 @@ Input: JSON object containing:
     - args: Additional arguments passed to the script (optional)
 
 Note: Only stderr output is monitored. If the script returns a non-zero exit code, the error will be logged.
+
+Set FILTER_DEBUG=1 to print diagnostic messages to stderr.
+
+The orjson and pysimdjson accelerators are optional. Without them the script
+only needs the standard library.
 """
+import os
 import sys
-import json
 
-def main():
+try:
+    import orjson as json
+except ImportError:
+    import json
+
+try:
+    import simdjson
+    _parser = simdjson.Parser()
+except ImportError:
+    simdjson = None
+
+DEBUG = os.environ.get("FILTER_DEBUG") == "1"
+
+def get_args(input_data):
+    """Returns the script arguments from the raw input, or None if there are none.
+
+    Raises ValueError if the input is not valid JSON and TypeError if it is not a JSON object.
+    """
+    if simdjson is not None:
+        # Only args are read, so avoid materializing the monitor match
+        doc = _parser.parse(input_data)
+        if not isinstance(doc, simdjson.Object):
+            raise TypeError("Input JSON is not an object")
+        args = doc.get("args")
+        # Copy containers out so the result does not keep the parsed document alive
+        if isinstance(args, simdjson.Array):
+            return args.as_list()
+        if isinstance(args, simdjson.Object):
+            return args.as_dict()
+        return args
+
+    data = json.loads(input_data)
+    if not isinstance(data, dict):
+        raise TypeError("Input JSON is not an object")
+    return data.get('args')
+
+def notify(input_data):
+    """Processes a single JSON payload, returning True if it was handled successfully."""
+    if not input_data:
+        if DEBUG:
+            print("No input JSON provided", file=sys.stderr)
+        return False
+
+    # Parse input JSON
     try:
-        # Read input from stdin
-        input_data = sys.stdin.read()
-        if not input_data:
-            print("No input JSON provided", flush=True)
-
-        # Parse input JSON
-        try:
-            data = json.loads(input_data)
-            monitor_match = data['monitor_match']
-            args = data['args']
-            if args:
-                print(f"Args: {args}")
-        except json.JSONDecodeError as e:
-            print(f"Invalid JSON input: {e}", flush=True)
-
-
-    except Exception as e:
-        print(f"Error processing input: {e}", flush=True)
+        args = get_args(input_data)
+    except ValueError as e:
+        if DEBUG:
+            print(f"Invalid JSON input: {e}", file=sys.stderr)
+        return False
+    except TypeError as e:
+        if DEBUG:
+            print(e, file=sys.stderr)
+        return False
+
+    if args and DEBUG:
+        print(f"Args: {args}", file=sys.stderr)
+    return True
+
+def main():
+    # Read raw bytes from stdin in 64 KiB chunks until os.read() reports EOF
+    return notify(b"".join(iter(lambda: os.read(0, 1 << 16), b"")))
 
 if __name__ == "__main__":
     main()
@@ -242,12 +242,14 @@ mod tests {
 	use crate::{
 		models::{
 			AddressWithSpec, EVMMonitorMatch, EVMReceiptLog, EventCondition, FunctionCondition,
-			MatchConditions, Monitor, MonitorMatch, TransactionCondition,
+			MatchConditions, Monitor, MonitorMatch, StellarBlock, StellarLedgerInfo,
+			StellarMonitorMatch, StellarTransaction, StellarTransactionInfo, TransactionCondition,
 		},
 		utils::tests::evm::{
 			monitor::MonitorBuilder, receipt::ReceiptBuilder, transaction::TransactionBuilder,
 		},
 	};
+	use alloy::primitives::U64;
 	use std::{fs, path::Path, time::Instant};
 
 	fn read_fixture(filename: &str) -> String {
@@ -309,6 +311,42 @@ mod tests {
 		}))
 	}
 
+	fn create_mock_evm_monitor_match_with_block_number(block_number: u64) -> MonitorMatch {
+		MonitorMatch::EVM(Box::new(EVMMonitorMatch {
+			monitor: create_test_monitor(vec![], vec![], vec![], vec![]),
+			transaction: TransactionBuilder::new()
+				.block_number(U64::from(block_number))
+				.build(),
+			receipt: Some(ReceiptBuilder::new().build()),
+			logs: Some(create_test_evm_logs()),
+			network_slug: "evm_mainnet".to_string(),
+			matched_on: MatchConditions {
+				functions: vec![],
+				events: vec![],
+				transactions: vec![],
+			},
+			matched_on_args: None,
+		}))
+	}
+
+	fn create_mock_stellar_monitor_match_with_sequence(sequence: u32) -> MonitorMatch {
+		MonitorMatch::Stellar(Box::new(StellarMonitorMatch {
+			monitor: create_test_monitor(vec![], vec![], vec![], vec![]),
+			transaction: StellarTransaction::from(StellarTransactionInfo::default()),
+			ledger: StellarBlock::from(StellarLedgerInfo {
+				sequence,
+				..Default::default()
+			}),
+			network_slug: "stellar_mainnet".to_string(),
+			matched_on: MatchConditions {
+				functions: vec![],
+				events: vec![],
+				transactions: vec![],
+			},
+			matched_on_args: None,
+		}))
+	}
+
 	#[tokio::test]
 	async fn test_python_script_executor_success() {
 		let script_content = r#"
@@ -765,6 +803,54 @@ else:
 		assert!(!result.unwrap());
 	}
 
+	#[tokio::test]
+	async fn test_python_script_executor_evm_filter_even_block() {
+		let script_content = read_fixture("evm_filter_block_number.py");
+		let executor = PythonScriptExecutor { script_content };
+
+		let input = create_mock_evm_monitor_match_with_block_number(0x1a);
+		let result = executor.execute(input, &1000, None, false).await;
+
+		assert!(result.is_ok());
+		assert!(result.unwrap());
+	}
+
+	#[tokio::test]
+	async fn test_python_script_executor_evm_filter_odd_block() {
+		let script_content = read_fixture("evm_filter_block_number.py");
+		let executor = PythonScriptExecutor { script_content };
+
+		let input = create_mock_evm_monitor_match_with_block_number(0x1b);
+		let result = executor.execute(input, &1000, None, false).await;
+
+		assert!(result.is_ok());
+		assert!(!result.unwrap());
+	}
+
+	#[tokio::test]
+	async fn test_python_script_executor_stellar_filter_even_ledger() {
+		let script_content = read_fixture("stellar_filter_block_number.py");
+		let executor = PythonScriptExecutor { script_content };
+
+		let input = create_mock_stellar_monitor_match_with_sequence(12346);
+		let result = executor.execute(input, &1000, None, false).await;
+
+		assert!(result.is_ok());
+		assert!(result.unwrap());
+	}
+
+	#[tokio::test]
+	async fn test_python_script_executor_stellar_filter_odd_ledger() {
+		let script_content = read_fixture("stellar_filter_block_number.py");
+		let executor = PythonScriptExecutor { script_content };
+
+		let input = create_mock_stellar_monitor_match_with_sequence(12345);
+		let result = executor.execute(input, &1000, None, false).await;
+
+		assert!(result.is_ok());
+		assert!(!result.unwrap());
+	}
+
 	#[tokio::test]
 	async fn test_script_executor_with_ignore_output() {
 		let script_content = r#"
@@ -1,6 +1,6 @@
 use crate::models::{EVMBaseTransaction, EVMTransaction};
 use alloy::{
-	primitives::{Address, Bytes, B256, U256},
+	primitives::{Address, Bytes, B256, U256, U64},
 	rpc::types::Index,
 };
 
@@ -18,6 +18,7 @@ pub struct TransactionBuilder {
 	gas_limit: Option<U256>,
 	nonce: Option<U256>,
 	transaction_index: Option<Index>,
+	block_number: Option<U64>,
 }
 
 impl TransactionBuilder {
@@ -92,6 +93,12 @@ impl TransactionBuilder {
 		self
 	}
 
+	/// Sets the number of the block that includes the transaction.
+	pub fn block_number(mut self, block_number: U64) -> Self {
+		self.block_number = Some(block_number);
+		self
+	}
+
 	/// Builds the Transaction instance.
 	pub fn build(self) -> EVMTransaction {
 		let default_gas_limit = U256::from(21000);
@@ -108,6 +115,7 @@ impl TransactionBuilder {
 			value: self.value.unwrap_or_default(),
 			input: self.input.unwrap_or_default(),
 			transaction_index: self.transaction_index,
+			block_number: self.block_number,
 			..Default::default()
 		};
 
@@ -1,14 +1,30 @@
 #!/usr/bin/env python3
+import os
+import re
 import sys
 import json
-import logging
+
+# Set FILTER_DEBUG=1 to print diagnostic messages to stderr
+DEBUG = os.environ.get("FILTER_DEBUG") == "1"
+
+# Pre-encoded result lines written straight to the binary stdout buffer
+TRUE_OUTPUT = b"true\n"
+FALSE_OUTPUT = b"false\n"
+
+# EVM block numbers are 0x-prefixed hex quantities
+HEX_BLOCK_NUMBER_PATTERN = re.compile(r"0[xX][0-9a-fA-F]+")
+
+def is_even(number):
+    """Returns True if the given block number is even."""
+    return not (number & 1)
 
 def main():
     try:
         # Read input from stdin
         input_data = sys.stdin.read()
         if not input_data:
-            print("No input JSON provided", flush=True)
+            if DEBUG:
+                print("No input JSON provided", file=sys.stderr)
             return False
 
         # Parse input JSON
@@ -17,31 +33,38 @@ def main():
             monitor_match = data['monitor_match']
             args = data['args']
         except json.JSONDecodeError as e:
-            print(f"Invalid JSON input: {e}", flush=True)
+            if DEBUG:
+                print(f"Invalid JSON input: {e}", file=sys.stderr)
             return False
 
-        # Extract block_number
-        block_number = None
-        if "EVM" in monitor_match:
-            hex_block = monitor_match['EVM']['transaction'].get('blockNumber')
-            if hex_block:
-                # Convert hex string to integer
-                block_number = int(hex_block, 16)
+        # Extract the hex block number
+        try:
+            hex_block = monitor_match['EVM']['transaction']['blockNumber']
+        except KeyError:
+            hex_block = None
+
+        if not hex_block:
+            if DEBUG:
+                print("Block number is None", file=sys.stderr)
+            return False
 
-        if block_number is None:
-            print("Block number is None")
+        if not HEX_BLOCK_NUMBER_PATTERN.fullmatch(hex_block):
+            if DEBUG:
+                print(f"Block number {hex_block} is not a valid hex number", file=sys.stderr)
             return False
 
-        result = block_number % 2 == 0
-        print(f"Block number {block_number} is {'even' if result else 'odd'}", flush=True)
-        logging.info(f"Block number {block_number} is {'even' if result else 'odd'}")
+        # A hex number has the same parity as its last digit, so skip converting the whole string
+        result = is_even(int(hex_block[-1], 16))
+        if DEBUG:
+            print(f"Block number {hex_block} is {'even' if result else 'odd'}", file=sys.stderr)
         return result
 
     except Exception as e:
-        print(f"Error processing input: {e}", flush=True)
+        if DEBUG:
+            print(f"Error processing input: {e}", file=sys.stderr)
         return False
 
 if __name__ == "__main__":
     result = main()
     # Print the final boolean result
-    print(str(result).lower(), flush=True)
+    sys.stdout.buffer.write(TRUE_OUTPUT if result else FALSE_OUTPUT)
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 import sys
 import json
-import logging
 
 def main():
     try:
@@ -22,7 +21,6 @@ def main():
         # Check if --verbose is in args
         result = '--verbose' in args
         print(f"Verbose mode is {'enabled' if result else 'disabled'}", flush=True)
-        logging.info(f"Verbose mode is {'enabled' if result else 'disabled'}")
         return result
 
     except Exception as e:
@@ -1,14 +1,26 @@
 #!/usr/bin/env python3
+import os
 import sys
 import json
-import logging
+
+# Set FILTER_DEBUG=1 to print diagnostic messages to stderr
+DEBUG = os.environ.get("FILTER_DEBUG") == "1"
+
+# Pre-encoded result lines written straight to the binary stdout buffer
+TRUE_OUTPUT = b"true\n"
+FALSE_OUTPUT = b"false\n"
+
+def is_even(number):
+    """Returns True if the given ledger number is even."""
+    return not (number & 1)
 
 def main():
     try:
         # Read input from stdin
         input_data = sys.stdin.read()
         if not input_data:
-            print("No input JSON provided", flush=True)
+            if DEBUG:
+                print("No input JSON provided", file=sys.stderr)
             return False
 
         # Parse input JSON
@@ -17,30 +29,37 @@ def main():
             monitor_match = data['monitor_match']
             args = data['args']
         except json.JSONDecodeError:
-            print("Invalid JSON input", flush=True)
+            if DEBUG:
+                print("Invalid JSON input", file=sys.stderr)
             return False
 
         # Extract ledger_number
+        try:
+            ledger = monitor_match['Stellar']['ledger']['sequence']
+        except KeyError:
+            ledger = None
+
         ledger_number = None
-        if "Stellar" in monitor_match:
-            ledger = monitor_match['Stellar']['ledger'].get('sequence')
-            if ledger:
-                ledger_number = int(ledger)
+        if ledger:
+            ledger_number = int(ledger)
 
         if ledger_number is None:
-            print("Ledger number is None", flush=True)
+            if DEBUG:
+                print("Ledger number is None", file=sys.stderr)
             return False
 
         # Return True for even ledger numbers, False for odd
-        result = ledger_number % 2 == 0
-        print(f"Ledger number {ledger_number} is {'even' if result else 'odd'}", flush=True)
+        result = is_even(ledger_number)
+        if DEBUG:
+            print(f"Ledger number {ledger_number} is {'even' if result else 'odd'}", file=sys.stderr)
         return result
 
     except Exception as e:
-        print(f"Error processing input: {e}", flush=True)
+        if DEBUG:
+            print(f"Error processing input: {e}", file=sys.stderr)
         return False
 
 if __name__ == "__main__":
     result = main()
     # Only print the final boolean result
-    print(str(result).lower(), flush=True)
+    sys.stdout.buffer.write(TRUE_OUTPUT if result else FALSE_OUTPUT)